@@ -21,9 +21,10 @@
 # SOFTWARE.
 
 
+import math
+from typing import Tuple
+
 import torch
-import torch.distributions as D
-from torch.func import vmap
 from omni.isaac.core.objects import DynamicCuboid, DynamicCylinder
 from tensordict.tensordict import TensorDict, TensorDictBase
 from torchrl.data import CompositeSpec, UnboundedContinuousTensorSpec, DiscreteTensorSpec
@@ -33,12 +34,137 @@ import omni_drones.utils.scene as scene_utils
 
 from omni_drones.envs.isaac_env import AgentSpec, IsaacEnv
 from omni_drones.views import RigidPrimView
-from omni_drones.utils.torch import cpos, off_diag, others, quat_axis, euler_to_quaternion
+from omni_drones.utils.torch import quat_axis, euler_to_quaternion
 from omni_drones.robots.drone import MultirotorBase
 
 from .utils import ManipulationGroup, ManipulationCfg
 
 
+@torch.jit.script
+def compute_rope_reward(
+    target_payload_rpose: torch.Tensor,
+    drone_pdist: torch.Tensor,
+    payload_up: torch.Tensor,
+    vels: torch.Tensor,
+    effort: torch.Tensor,
+    joint_positions: torch.Tensor,
+    throttle_difference: torch.Tensor,
+    reward_distance_scale: float,
+    reward_spin_weight: float,
+    reward_swing_weight: float,
+    reward_effort_weight: float,
+    reward_action_smoothness_weight: float,
+    safe_distance: float,
+    n_drones: int,
+) -> torch.Tensor:
+    """Fused reward kernel for :py:class:`RopeDragging`.
+
+    Scripted so the long chain of small elementwise ops is fused into a few
+    kernels instead of one launch per op.
+    """
+    vel_chunks = torch.split(vels, 3, dim=-1)
+    lin_vel, ang_vel = vel_chunks[0], vel_chunks[1]
+
+    distance = torch.norm(target_payload_rpose, dim=-1, keepdim=True)
+    # [E, n, n-1, 1] -> [E, 1], reducing both pair dimensions in one kernel
+    separation = torch.amin(drone_pdist, dim=[-3, -2])
+
+    reward_pose = torch.exp(-distance * reward_distance_scale)
+
+    up = payload_up[:, 2]
+    reward_up = torch.square((up + 1) / 2).unsqueeze(-1)
+
+    # spin and swing share the exp(-square(l1_norm(.))) form, so evaluate
+    # them batched over a stacked leading dimension in one set of launches
+    spin_swing = torch.linalg.vector_norm(
+        torch.stack([ang_vel, lin_vel]), ord=1, dim=-1, keepdim=True
+    )
+    spin_swing = torch.exp(-torch.square(spin_swing))
+    reward_spin = reward_spin_weight * spin_swing[0]
+    reward_swing = reward_swing_weight * spin_swing[1]
+
+    reward_effort = reward_effort_weight * torch.exp(-effort).mean(-1, keepdim=True)
+    reward_separation = torch.square(separation / safe_distance).clamp(0, 1)
+    reward_joint_limit = 0.5 * torch.mean(1 - torch.square(joint_positions), dim=-1)
+
+    reward_action_smoothness = reward_action_smoothness_weight * -throttle_difference
+
+    # Build the composite in-place to avoid allocating a full-size temporary
+    # per term; only the joint-limit add stays out-of-place as it broadcasts
+    reward = reward_up + reward_spin
+    reward.add_(reward_swing)
+    reward.mul_(reward_pose).add_(reward_pose)
+    reward = reward + reward_joint_limit
+    reward.add_(reward_action_smoothness.mean(1, True))
+    reward.add_(reward_effort)
+    reward.mul_(reward_separation)
+    return reward.unsqueeze(-1).expand(-1, n_drones, -1).contiguous()
+
+
+def compute_obs(
+    drone_states: torch.Tensor,
+    payload_pos: torch.Tensor,
+    payload_rot: torch.Tensor,
+    payload_target_heading: torch.Tensor,
+    identity: torch.Tensor,
+    offdiag_row: torch.Tensor,
+    offdiag_col: torch.Tensor,
+    others_idx: torch.Tensor,
+    payload_target_height: float,
+    n_drones: int,
+):
+    """Pure-tensor part of the observation computation, factored out of
+    :py:meth:`RopeDragging._compute_state_and_obs` so it can be wrapped with
+    ``torch.compile`` (shapes are static, enabling CUDA-graph capture)."""
+    drone_pos = drone_states[..., :3]
+    payload_heading = quat_axis(payload_rot, axis=0)
+    payload_up = quat_axis(payload_rot, axis=2)
+
+    rpos = drone_pos.unsqueeze(-2) - drone_pos.unsqueeze(-3)
+    drone_rpos = rpos[:, offdiag_row, offdiag_col].unflatten(1, (n_drones, n_drones - 1))
+    drone_pdist = torch.norm(drone_rpos, dim=-1, keepdim=True)
+    payload_drone_rpos = payload_pos.unsqueeze(1) - drone_pos
+
+    payload_target_rpos = -payload_pos
+    payload_target_rpos[..., 2] += payload_target_height
+    target_payload_rpose = torch.cat([
+        payload_target_rpos,
+        payload_target_heading - payload_heading
+    ], dim=-1)
+
+    obs_self = torch.cat(
+        [-payload_drone_rpos, drone_states[..., 3:], identity], dim=-1
+    ).unsqueeze(2) # [..., 1, state_dim]
+    obs_others = torch.cat(
+        [drone_rpos, drone_pdist, drone_states[..., 3:13][:, others_idx]], dim=-1
+    ) # [..., n-1, state_dim + 1]
+
+    pos_error = target_payload_rpose[..., :3].norm(dim=-1, keepdim=True)
+    heading_alignment = torch.sum(
+        payload_heading * payload_target_heading, dim=-1, keepdim=True
+    )
+    return (
+        drone_rpos,
+        drone_pdist,
+        target_payload_rpose,
+        payload_heading,
+        payload_up,
+        obs_self,
+        obs_others,
+        pos_error,
+        heading_alignment,
+    )
+
+
+@torch.jit.script
+def compute_termination(drone_states: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Fused termination check: one pass over ``drone_states`` for both the
+    low-altitude and the non-finite condition."""
+    misbehave = (drone_states[..., 2] < 0.2).any(-1, keepdim=True)
+    nonfinite = (~torch.isfinite(drone_states)).flatten(1).any(-1, keepdim=True)
+    return misbehave, nonfinite
+
+
 class RopeDragging(IsaacEnv):
     r"""
     A cooperative control task where two quadcopters are connected by a rope and,
@@ -79,18 +205,25 @@ class RopeDragging(IsaacEnv):
     | `mass_scale`    | List[float, float] | [0.5, 0.8]    | A tuple of two values that specifies the range of the payload mass to sample from in each episode (as ratio to the drone's mass). |
     """
     def __init__(self, cfg, headless):
-        self.reward_effort_weight = cfg.task.reward_effort_weight
-        self.reward_spin_weight = cfg.task.reward_spin_weight
-        self.reward_swing_weight = cfg.task.reward_swing_weight
-        self.reward_action_smoothness_weight = cfg.task.reward_action_smoothness_weight
-        self.reward_distance_scale = cfg.task.reward_distance_scale
+        self.reward_effort_weight = float(cfg.task.reward_effort_weight)
+        self.reward_spin_weight = float(cfg.task.reward_spin_weight)
+        self.reward_swing_weight = float(cfg.task.reward_swing_weight)
+        self.reward_action_smoothness_weight = float(cfg.task.reward_action_smoothness_weight)
+        self.reward_distance_scale = float(cfg.task.reward_distance_scale)
         self.time_encoding = cfg.task.time_encoding
-        self.safe_distance = cfg.task.safe_distance
+        self.safe_distance = float(cfg.task.safe_distance)
+        # Policy-facing obs precision; physics-facing tensors stay FP32
+        self.obs_dtype = (
+            torch.bfloat16 if cfg.task.get("obs_bf16", False) else torch.float32
+        )
 
         super().__init__(cfg, headless)
 
         self.group.initialize()
         self.payload = self.group.payload_view
+        # Joint limits are fixed, so cache the reciprocal used to normalize
+        # joint positions and turn the per-step division into a multiply
+        self._joint_limit_inv = self.group.joint_limits[..., :16, 0].abs().reciprocal_()
 
         self.payload_target_visual = RigidPrimView(
             "/World/envs/.*/payloadTargetVis",
@@ -107,30 +240,53 @@ class RopeDragging(IsaacEnv):
         self.init_drone_vels = torch.zeros_like(self.drone.get_velocities())
 
         # Bounds for the payload rotation
-        self.payload_target_rpy_dist = D.Uniform(
-            torch.tensor([0., 0., 0.], device=self.device) * torch.pi,
-            torch.tensor([0., 0., 0.], device=self.device) * torch.pi
-        )
+        self.payload_target_rpy_bounds = ((0., 0.), (0., 0.), (0., 0.))
         # Bounds for the payload mass
         payload_mass_scale = self.cfg.task.payload_mass_scale
-        self.payload_mass_dist = D.Uniform(
-            torch.as_tensor(payload_mass_scale[0] * self.drone.MASS_0.sum(), device=self.device),
-            torch.as_tensor(payload_mass_scale[1] * self.drone.MASS_0.sum(), device=self.device)
+        drone_mass = float(self.drone.MASS_0.sum())
+        self.payload_mass_bounds = (
+            payload_mass_scale[0] * drone_mass,
+            payload_mass_scale[1] * drone_mass
         )
         # Bounds for the initial position of the drones
-        self.init_pos_dist = D.Uniform(
-            torch.tensor([-3, -3, 1.], device=self.device),
-            torch.tensor([3., 3., 2.5], device=self.device)
-        )
+        self.init_pos_bounds = ((-3., 3.), (-3., 3.), (1., 2.5))
         # Bounds for the initial rotation of the drones
-        self.init_rpy_dist = D.Uniform(
-            torch.tensor([0., 0., 0.], device=self.device) * torch.pi,
-            torch.tensor([0., 0., 2.], device=self.device) * torch.pi
-        )
-        self.payload_target_pos = torch.tensor([0., 0., 2.], device=self.device)
+        self.init_rpy_bounds = ((0., 0.), (0., 0.), (0., 2. * math.pi))
+        # Scratch buffers filled in-place with Tensor.uniform_ on reset
+        self._init_pos_buf = torch.empty(self.num_envs, 3, device=self.device)
+        self._init_rpy_buf = torch.empty(self.num_envs, 3, device=self.device)
+        self._payload_target_rpy_buf = torch.empty(self.num_envs, 3, device=self.device)
+        self._payload_mass_buf = torch.empty(self.num_envs, device=self.device)
+        # The target sits on the z-axis, so only its height is needed
+        self.payload_target_height = 2.0
         self.payload_target_heading = torch.zeros(self.num_envs, 3, device=self.device)
         self.last_distance = torch.zeros(self.num_envs, 1, device=self.device)
 
+        # Static indices replacing vmap(off_diag)/vmap(others) in the obs computation
+        not_eye = ~torch.eye(self.drone.n, dtype=torch.bool, device=self.device)
+        self._offdiag_idx = not_eye.nonzero(as_tuple=True)
+        self._others_idx = not_eye.nonzero()[:, 1].reshape(self.drone.n, self.drone.n - 1)
+        # One-hot drone identities, broadcast over envs (zero-copy view)
+        self._identity = (
+            torch.eye(self.drone.n, device=self.device)
+            .unsqueeze(0)
+            .expand(self.num_envs, -1, -1)
+        )
+        # Persistent output buffer for the payload state, filled slice-wise
+        self._payload_state_buf = torch.empty(
+            self.num_envs, 1, self.payload_state_dim, device=self.device
+        )
+        # Target visual positions passed to set_world_poses on reset
+        self._target_pos_buf = torch.zeros(self.num_envs, 3, device=self.device)
+        # Optionally compile the pure-tensor observation math; shapes are
+        # static so "reduce-overhead" can capture the whole step as a CUDA graph
+        if self.cfg.task.get("use_torch_compile", False):
+            self._compute_obs = torch.compile(
+                compute_obs, mode="reduce-overhead", fullgraph=True, dynamic=False
+            )
+        else:
+            self._compute_obs = compute_obs
+
         self.alpha = 0.8
 
     def _design_scene(self):
@@ -175,16 +331,17 @@ class RopeDragging(IsaacEnv):
         if self.time_encoding:
             self.time_encoding_dim = 4
             payload_state_dim += self.time_encoding_dim
+        self.payload_state_dim = payload_state_dim
 
         # Define the observation space
         observation_spec = CompositeSpec({
-            "obs_self": UnboundedContinuousTensorSpec((1, drone_state_dim)),
-            "obs_others": UnboundedContinuousTensorSpec((self.drone.n-1, 13+1)),
-            "obs_payload": UnboundedContinuousTensorSpec((1, payload_state_dim)),
+            "obs_self": UnboundedContinuousTensorSpec((1, drone_state_dim), dtype=self.obs_dtype),
+            "obs_others": UnboundedContinuousTensorSpec((self.drone.n-1, 13+1), dtype=self.obs_dtype),
+            "obs_payload": UnboundedContinuousTensorSpec((1, payload_state_dim), dtype=self.obs_dtype),
         }).to(self.device)
         observation_central_spec = CompositeSpec({
-            "state_drones": UnboundedContinuousTensorSpec((self.drone.n, drone_state_dim)),
-            "state_payload": UnboundedContinuousTensorSpec((1, payload_state_dim)),
+            "state_drones": UnboundedContinuousTensorSpec((self.drone.n, drone_state_dim), dtype=self.obs_dtype),
+            "state_payload": UnboundedContinuousTensorSpec((1, payload_state_dim), dtype=self.obs_dtype),
         }).to(self.device)
         self.observation_spec = CompositeSpec({
             "agents": {
@@ -226,8 +383,12 @@ class RopeDragging(IsaacEnv):
         self.stats = stats_spec.zero()
 
     def _reset_idx(self, env_ids: torch.Tensor):
-        pos = self.init_pos_dist.sample(env_ids.shape)
-        rpy = self.init_rpy_dist.sample(env_ids.shape)
+        pos = self._init_pos_buf[:len(env_ids)]
+        rpy = self._init_rpy_buf[:len(env_ids)]
+        for dim, (low, high) in enumerate(self.init_pos_bounds):
+            pos[:, dim].uniform_(low, high)
+        for dim, (low, high) in enumerate(self.init_rpy_bounds):
+            rpy[:, dim].uniform_(low, high)
         rot = euler_to_quaternion(rpy)
         heading = quat_axis(rot, 0)
         # pos = torch.tensor([[0.0, 0.0, 2.0]], device='cuda')
@@ -241,24 +402,28 @@ class RopeDragging(IsaacEnv):
         self.group.set_joint_velocities(self.init_joint_vel[env_ids], env_ids)
 
         # Payload stuff
-        payload_target_rpy = self.payload_target_rpy_dist.sample(env_ids.shape)
+        payload_target_rpy = self._payload_target_rpy_buf[:len(env_ids)]
+        for dim, (low, high) in enumerate(self.payload_target_rpy_bounds):
+            payload_target_rpy[:, dim].uniform_(low, high)
         payload_target_rot = euler_to_quaternion(payload_target_rpy)
         payload_target_heading = quat_axis(payload_target_rot, 0)
-        payload_masses = self.payload_mass_dist.sample(env_ids.shape)
+        payload_masses = self._payload_mass_buf[:len(env_ids)].uniform_(*self.payload_mass_bounds)
 
         self.payload_target_heading[env_ids] = payload_target_heading
 
         self.payload.set_masses(payload_masses, env_ids)
         self.payload_target_visual.set_world_poses(
             # We can change the target position here
-            positions=torch.tensor([[0., 0., 0.]],device='cuda').reshape(-1,3),
+            positions=self._target_pos_buf[:len(env_ids)],
             orientations=payload_target_rot,
             env_indices=env_ids
         )
 
         self.stats[env_ids] = 0.
+        target_rpos = -pos
+        target_rpos[..., 2] += self.payload_target_height
         distance = torch.cat([
-            self.payload_target_pos-pos,
+            target_rpos,
             payload_target_heading-heading,
         ], dim=-1).norm(dim=-1, keepdim=True)
         self.last_distance[env_ids] = distance
@@ -271,52 +436,59 @@ class RopeDragging(IsaacEnv):
         self.drone_states = self.drone.get_state()
         self.group.get_state()
         payload_vels = self.payload.get_velocities()
-        drone_pos = self.drone_states[..., :3]
+        # Reused by _compute_reward_and_done to avoid a second sim-buffer read
+        self.payload_vels = payload_vels
 
         self.payload_pos, self.payload_rot = self.get_env_poses(self.payload.get_world_poses())
-        self.payload_heading: torch.Tensor = quat_axis(self.payload_rot, axis=0)
-        self.payload_up: torch.Tensor = quat_axis(self.payload_rot, axis=2)
 
-        self.drone_rpos = vmap(cpos)(drone_pos, drone_pos)
-        self.drone_rpos = vmap(off_diag)(self.drone_rpos)
-        self.drone_pdist = torch.norm(self.drone_rpos, dim=-1, keepdim=True)
-        payload_drone_rpos = self.payload_pos.unsqueeze(1) - drone_pos
-
-        self.target_payload_rpose = torch.cat([
-            self.payload_target_pos - self.payload_pos,
-            self.payload_target_heading - self.payload_heading
-        ], dim=-1)
-
-        payload_state = [
+        (
+            self.drone_rpos,
+            self.drone_pdist,
             self.target_payload_rpose,
-            self.payload_rot,  # 4
-            payload_vels,  # 6
-            self.payload_heading,  # 3
-            self.payload_up, # 3
-        ]
+            self.payload_heading,
+            self.payload_up,
+            obs_self,
+            obs_others,
+            self.pos_error,
+            self.heading_alignment,
+        ) = self._compute_obs(
+            self.drone_states,
+            self.payload_pos,
+            self.payload_rot,
+            self.payload_target_heading,
+            self._identity,
+            self._offdiag_idx[0],
+            self._offdiag_idx[1],
+            self._others_idx,
+            self.payload_target_height,
+            self.drone.n,
+        )
+
+        payload_state = self._payload_state_buf
+        payload_state[:, 0, 0:6] = self.target_payload_rpose
+        payload_state[:, 0, 6:10] = self.payload_rot
+        payload_state[:, 0, 10:16] = payload_vels
+        payload_state[:, 0, 16:19] = self.payload_heading
+        payload_state[:, 0, 19:22] = self.payload_up
         if self.time_encoding:
             t = (self.progress_buf / self.max_episode_length).unsqueeze(-1)
-            payload_state.append(t.expand(-1, self.time_encoding_dim))
-        payload_state = torch.cat(payload_state, dim=-1).unsqueeze(1)
+            payload_state[:, 0, 22:] = t
 
         obs = TensorDict({}, [self.num_envs, self.drone.n])
-        identity = torch.eye(self.drone.n, device=self.device).expand(self.num_envs, -1, -1)
-        obs["obs_self"] = torch.cat(
-            [-payload_drone_rpos, self.drone_states[..., 3:], identity], dim=-1
-        ).unsqueeze(2) # [..., 1, state_dim]
-        obs["obs_others"] = torch.cat(
-            [self.drone_rpos, self.drone_pdist, vmap(others)(self.drone_states[..., 3:13])], dim=-1
-        ) # [..., n-1, state_dim + 1]
-        obs["obs_payload"] = payload_state.expand(-1, self.drone.n, -1).unsqueeze(2) # [..., 1, 22]
+        obs["obs_self"] = obs_self # [..., 1, state_dim]
+        obs["obs_others"] = obs_others # [..., n-1, state_dim + 1]
+        # The payload block is stored once in self._payload_state_buf; both the
+        # per-agent obs and the central state are zero-copy broadcast views of it,
+        # so no agent-duplicated storage is materialized on the env side.
+        obs["obs_payload"] = payload_state.unsqueeze(1).expand(-1, self.drone.n, -1, -1) # [..., 1, 22]
 
         state = TensorDict({}, self.num_envs)
         state["state_payload"] = payload_state # [..., 1, 22]
         state["state_drones"] = obs["obs_self"].squeeze(2) # [..., n, state_dim]
 
-        self.pos_error = self.target_payload_rpose[..., :3].norm(dim=-1, keepdim=True)
-        self.heading_alignment = torch.sum(
-            self.payload_heading * self.payload_target_heading, dim=-1, keepdim=True
-        )
+        if self.obs_dtype is not torch.float32:
+            obs = obs.to(self.obs_dtype)
+            state = state.to(self.obs_dtype)
 
         return TensorDict(
             {
@@ -330,62 +502,62 @@ class RopeDragging(IsaacEnv):
         )
 
     def _compute_reward_and_done(self):
-        vels = self.payload.get_velocities()
-        joint_positions = (
-            self.group.get_joint_positions()[..., :16]
-            / self.group.joint_limits[..., :16, 0].abs()
-        )
-
-        distance = torch.norm(self.target_payload_rpose, dim=-1, keepdim=True)
-        separation = self.drone_pdist.min(dim=-2).values.min(dim=-2).values
-
-        reward = torch.zeros(self.num_envs, self.drone.n, 1, device=self.device)
-        reward_pose = torch.exp(-distance * self.reward_distance_scale)
-
-        up = self.payload_up[:, 2]
-        reward_up = torch.square((up + 1) / 2).unsqueeze(-1)
-
-        spinnage = vels[:, -3:].abs().sum(-1, keepdim=True)
-        reward_spin = self.reward_spin_weight * torch.exp(-torch.square(spinnage))
+        vels = self.payload_vels
+        joint_positions = self.group.get_joint_positions()[..., :16] * self._joint_limit_inv
+        throttle_difference = self.drone.throttle_difference
 
-        swing = vels[:, :3].abs().sum(-1, keepdim=True)
-        reward_swing = self.reward_swing_weight * torch.exp(-torch.square(swing))
-
-        reward_effort = self.reward_effort_weight * torch.exp(-self.effort).mean(-1, keepdim=True)
-        reward_separation = torch.square(separation / self.safe_distance).clamp(0, 1)
-        reward_joint_limit = 0.5 * torch.mean(1 - torch.square(joint_positions), dim=-1)
-
-        reward_action_smoothness = self.reward_action_smoothness_weight * -self.drone.throttle_difference
-
-        reward[:] = (
-            reward_separation * (
-                reward_pose
-                + reward_pose * (reward_up + reward_spin + reward_swing)
-                + reward_joint_limit
-                + reward_action_smoothness.mean(1, True)
-                + reward_effort
-            )
-        ).unsqueeze(-1)
+        reward = compute_rope_reward(
+            self.target_payload_rpose,
+            self.drone_pdist,
+            self.payload_up,
+            vels,
+            self.effort,
+            joint_positions,
+            throttle_difference,
+            self.reward_distance_scale,
+            self.reward_spin_weight,
+            self.reward_swing_weight,
+            self.reward_effort_weight,
+            self.reward_action_smoothness_weight,
+            self.safe_distance,
+            self.drone.n,
+        )
 
-        misbehave = (self.drone_states[..., 2] < 0.2).any(-1, keepdim=True)
-        hasnan = torch.isnan(self.drone_states).any(-1)
+        misbehave, nonfinite = compute_termination(self.drone_states)
 
-        terminated = misbehave | hasnan.any(-1, keepdim=True)
+        terminated = misbehave | nonfinite
         truncated = (self.progress_buf >= self.max_episode_length).unsqueeze(-1)
+        done = terminated | truncated
 
         self.stats["return"].add_(reward.mean(1))
         self.stats["episode_len"][:] = self.progress_buf.unsqueeze(-1)
-        self.stats["pos_error"].lerp_(self.pos_error, (1-self.alpha))
-        self.stats["heading_alignment"].lerp_(self.heading_alignment, (1-self.alpha))
-        self.stats["uprightness"].lerp_(self.payload_up[:, 2].unsqueeze(-1), (1-self.alpha))
-        self.stats["action_smoothness"].lerp_(-self.drone.throttle_difference, (1-self.alpha))
+        # Batch the four running-average updates into one kernel launch. Envs
+        # that are done this step get a zero lerp weight so their stats are
+        # frozen at the final value (boolean indexing would lerp_ into a copy
+        # instead of the stored tensors).
+        lerp_weight = (1-self.alpha) * (~done).float()
+        torch._foreach_lerp_(
+            [
+                self.stats["pos_error"],
+                self.stats["heading_alignment"],
+                self.stats["uprightness"],
+                self.stats["action_smoothness"],
+            ],
+            [
+                self.pos_error,
+                self.heading_alignment,
+                self.payload_up[:, 2].unsqueeze(-1),
+                -throttle_difference,
+            ],
+            [lerp_weight, lerp_weight, lerp_weight, lerp_weight.expand(-1, self.drone.n)],
+        )
 
         return TensorDict(
             {
                 "agents": {
                     "reward": reward,
                 },
-                "done": terminated | truncated,
+                "done": done,
                 "terminated": terminated,
                 "truncated": truncated,
             },